@@ -1,13 +1,15 @@
 #!/usr/bin/env python3
 import argparse
-import json
+import functools
+import hashlib
 import os
-import shutil
 import subprocess
 import sys
-import tempfile
 from pathlib import Path
 
+# json, re, shutil, tempfile, and concurrent.futures are imported lazily in
+# the functions that need them to keep cold-start time down on fast paths
+
 PREFERRED_GENERATORS = [
     "Ninja Multi-Config",
     "Ninja",
@@ -21,6 +23,15 @@ LOG_FILE = Path("build_output.log")
 PREFERRED_COMPILERS_C = ["cc", "gcc", "clang", "cl"]
 PREFERRED_COMPILERS_CXX = ["c++", "g++", "clang++", "cl"]
 
+# Lowercased names with an O(1) membership check; the substring fallback in
+# is_multi_config covers generators not listed here (e.g. other VS years)
+MULTI_CONFIG_GENERATORS = frozenset({
+    "ninja multi-config",
+    "xcode",
+    "visual studio 17 2022",
+    "visual studio 16 2019",
+})
+
 
 def fail(message: str, code: int = 1) -> None:
     print(message)
@@ -32,7 +43,14 @@ def fail_with_log(message: str, log_file: Path, code: int = 1) -> None:
     print(f"---- build log ({log_file}) ----")
     if log_file.exists():
         try:
-            print(log_file.read_text(encoding="utf-8"))
+            import shutil
+
+            # Failed-build logs can be many MB; stream raw bytes in chunks
+            # instead of decoding the whole file into one string
+            sys.stdout.flush()
+            with log_file.open("rb") as log:
+                shutil.copyfileobj(log, sys.stdout.buffer, length=65536)
+            sys.stdout.buffer.flush()
         except OSError:
             print("(failed to read log)")
     else:
@@ -41,7 +59,49 @@ def fail_with_log(message: str, log_file: Path, code: int = 1) -> None:
     sys.exit(code)
 
 
-def read_capabilities() -> dict:
+def _capabilities_cache_path() -> Path | None:
+    import tempfile
+
+    # Key the cache on the cmake version so upgrades invalidate it
+    try:
+        version = subprocess.run(
+            ["cmake", "--version"],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+    digest = hashlib.blake2b(version.encode("utf-8"), digest_size=8).hexdigest()
+    return Path(tempfile.gettempdir()) / f"cmake-caps-{digest}.json"
+
+
+def _extract_generator_names(stdout: str) -> list[str]:
+    import re
+
+    # Pull just the generator names out of the capabilities JSON; the full
+    # document is tens of KB of nested objects the script never reads
+    start = stdout.find('"generators"')
+    if start == -1:
+        return []
+    start = stdout.find("[", start)
+    if start == -1:
+        return []
+    depth = 0
+    end = len(stdout)
+    for i in range(start, len(stdout)):
+        char = stdout[i]
+        if char == "[":
+            depth += 1
+        elif char == "]":
+            depth -= 1
+            if depth == 0:
+                end = i
+                break
+    return re.findall(r'"name"\s*:\s*"([^"]+)"', stdout[start:end])
+
+
+def _probe_capabilities() -> dict:
     try:
         result = subprocess.run(
             ["cmake", "-E", "capabilities"],
@@ -49,33 +109,120 @@ def read_capabilities() -> dict:
             capture_output=True,
             text=True,
         )
-        return json.loads(result.stdout)
-    except (subprocess.CalledProcessError, FileNotFoundError, json.JSONDecodeError):
+    except (subprocess.CalledProcessError, FileNotFoundError):
         return {}
+    names = _extract_generator_names(result.stdout)
+    return {"generators": [{"name": name} for name in names]} if names else {}
+
+
+def read_capabilities() -> dict:
+    import json
+
+    cache = _capabilities_cache_path()
+    if cache is None:
+        return {}
+    if cache.exists():
+        try:
+            return json.loads(cache.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            pass
+    data = _probe_capabilities()
+    if data:
+        try:
+            tmp = cache.with_name(f"{cache.name}.{os.getpid()}")
+            tmp.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp, cache)
+        except OSError:
+            pass
+    return data
 
 
 def choose_generator(preferred: list[str]) -> str | None:
+    import shutil
+
     data = read_capabilities()
     available = {g.get("name") for g in data.get("generators", [])}
     for candidate in preferred:
-        if candidate in available:
-            return candidate
+        if candidate not in available:
+            continue
+        # Capabilities list generators compiled into cmake, not whether the
+        # underlying build tool is actually installed
+        if candidate.startswith("Ninja") and not shutil.which("ninja"):
+            continue
+        return candidate
+    return None
+
+
+def _read_cmake_cache_value(name: str) -> str | None:
+    prefix = f"{name}:"
+    try:
+        with Path("build/CMakeCache.txt").open(encoding="utf-8") as cache:
+            for line in cache:
+                if line.startswith(prefix):
+                    return line.split("=", 1)[1].strip()
+    except OSError:
+        pass
     return None
 
 
+def cached_generator() -> str | None:
+    # An existing build tree pins its generator; configuring with a
+    # different one is a hard cmake error, so reuse it instead of probing
+    return _read_cmake_cache_value("CMAKE_GENERATOR")
+
+
+def cached_build_type() -> str | None:
+    return _read_cmake_cache_value("CMAKE_BUILD_TYPE")
+
+
+def _fast_guess_generator() -> str:
+    import shutil
+
+    # Cheap guess for paths that only need is_multi_config(generator) to
+    # compute a binary path; mirrors what choose_generator would pick
+    # without forking cmake
+    if shutil.which("ninja"):
+        return "Ninja Multi-Config"
+    return "Visual Studio 17 2022" if os.name == "nt" else "Unix Makefiles"
+
+
 def choose_compiler(preferred: list[str]) -> str | None:
+    import shutil
+
+    # Scan each PATH directory once and probe all candidates against the
+    # result, instead of a full shutil.which walk per candidate
+    present: set[str] = set()
+    for directory in os.environ.get("PATH", "").split(os.pathsep):
+        if not directory:
+            continue
+        try:
+            with os.scandir(directory) as entries:
+                present.update(entry.name for entry in entries)
+        except OSError:
+            continue
     for compiler in preferred:
-        if shutil.which(compiler):
+        # The name set says nothing about file type or permissions; confirm
+        # a hit with shutil.which, which requires an executable regular file
+        if (compiler in present or f"{compiler}.exe" in present) and shutil.which(compiler):
             return compiler
+    # Windows applies PATHEXT and case-insensitive matching; recheck the
+    # slow way before declaring a miss
+    if os.name == "nt":
+        for compiler in preferred:
+            if shutil.which(compiler):
+                return compiler
     return None
 
 
+@functools.lru_cache(maxsize=None)
 def is_multi_config(generator: str) -> bool:
     name = generator.lower()
+    if name in MULTI_CONFIG_GENERATORS:
+        return True
     return "multi-config" in name or "visual studio" in name
 
 
-def configure_build(generator: str | None, log_file: Path, build_config: str, extra_args: list[str]) -> None:
+def configure_build(generator: str | None, log_fd: int, build_config: str, extra_args: list[str]) -> None:
     cmd = [
         "cmake",
         "-S",
@@ -92,38 +239,109 @@ def configure_build(generator: str | None, log_file: Path, build_config: str, ex
     # Pass any additional user-specified CMake configure args
     if extra_args:
         cmd.extend(extra_args)
-    with log_file.open("a", encoding="utf-8") as log:
-        log.write(f"Configuring with generator: {generator or 'default'}\n")
-        subprocess.run(cmd, check=True, stdout=log, stderr=log)
+    os.write(log_fd, f"Configuring with generator: {generator or 'default'}\n".encode("utf-8"))
+    run_logged(cmd, log_fd)
+
 
+def run_logged(cmd: list[str], log_fd: int) -> None:
+    # close_fds=False lets CPython launch the child via posix_spawn (vfork)
+    # instead of fork+exec, skipping the page-table copy of the interpreter;
+    # the only inheritable fd beyond std streams is the log itself
+    subprocess.run(cmd, check=True, stdout=log_fd, stderr=log_fd, close_fds=False)
+
+
+def binary_is_fresh(binary: Path, source: Path) -> bool:
+    try:
+        return binary.stat().st_mtime >= source.stat().st_mtime
+    except OSError:
+        return False
+
+
+def configure_is_fresh(generator: str | None, build_config: str, binary: Path) -> bool:
+    # Mirror CMake's own regeneration check without spawning cmake
+    cache = Path("build/CMakeCache.txt")
+    lists = Path("CMakeLists.txt")
+    try:
+        if cache.stat().st_mtime < lists.stat().st_mtime:
+            return False
+    except OSError:
+        return False
+    # Targets come from a CONFIGURE_DEPENDS glob, so a brand-new source file
+    # never touches CMakeLists.txt. Only Ninja regenerates its manifest
+    # before resolving command-line targets; Makefile/VS trees have no rule
+    # for the new target until configure reruns, so treat a missing binary
+    # as stale there
+    if not (generator and generator.startswith("Ninja")) and not binary.exists():
+        return False
+    # A -G that differs from the cached generator needs a fresh configure
+    # (cmake will reject it against this build tree, but fail loudly rather
+    # than silently building with the wrong generator)
+    if generator and cached_generator() != generator:
+        return False
+    # Single-config trees bake the build type in at configure time
+    if (not generator or not is_multi_config(generator)) and cached_build_type() != build_config:
+        return False
+    return True
+
+
+def build_target(target: str, generator: str | None, log_fd: int, build_config: str, extra_args: list[str]) -> None:
+    # --build-arg values are documented as cmake --build arguments, so any
+    # user-supplied args go through the cmake driver below
+    if generator and generator.startswith("Ninja") and not extra_args:
+        import shutil
+
+        # Drive ninja directly and skip the cmake --build middleman process;
+        # ninja re-runs cmake itself if the build files are stale
+        if shutil.which("ninja"):
+            cmd = ["ninja", "-C", "build", "-j", str(os.cpu_count() or 1)]
+            if is_multi_config(generator):
+                cmd.extend(["-f", f"build-{build_config}.ninja"])
+            cmd.append(target)
+            os.write(log_fd, f"Building target: {target}\n".encode("utf-8"))
+            run_logged(cmd, log_fd)
+            return
 
-def build_target(target: str, generator: str | None, log_file: Path, build_config: str, extra_args: list[str]) -> None:
     cmd = ["cmake", "--build", "build", "--target", target]
     if generator and is_multi_config(generator):
         cmd.extend(["--config", build_config])
+    # Use all cores unless the user already picked a job count
+    if not any(arg == "-j" or arg.startswith("-j") or arg == "--parallel" for arg in extra_args):
+        cmd.extend(["--parallel", str(os.cpu_count() or 1)])
     # Pass any additional user-specified CMake build args
     if extra_args:
         cmd.extend(extra_args)
-    with log_file.open("a", encoding="utf-8") as log:
-        log.write(f"Building target: {target}\n")
-        subprocess.run(cmd, check=True, stdout=log, stderr=log)
+    os.write(log_fd, f"Building target: {target}\n".encode("utf-8"))
+    run_logged(cmd, log_fd)
 
 
-def direct_compile(file_path: str, compiler: str, log_file: Path, is_c: bool) -> Path:
-    temp_dir = Path(tempfile.mkdtemp(prefix="c-run-" if is_c else "cpp-run-"))
-    output = temp_dir / ("a.exe" if os.name == "nt" else "a.out")
+def direct_compile(file_abs: Path, compiler: str, log_fd: int, is_c: bool, debug: bool = False) -> Path:
+    # Stable per-file output directory so repeat runs reuse the binary
+    # instead of recompiling into a fresh temp dir every time
+    key = hashlib.blake2b(f"{file_abs.as_posix()}|{int(debug)}".encode("utf-8"), digest_size=8).hexdigest()
+    out_dir = Path("build/_direct") / key
+    output = out_dir / ("a.exe" if os.name == "nt" else "a.out")
+    try:
+        if output.stat().st_mtime >= file_abs.stat().st_mtime:
+            os.write(log_fd, f"Cached binary is fresh for {file_abs}; skipping compile\n".encode("utf-8"))
+            return output
+    except OSError:
+        pass
+    out_dir.mkdir(parents=True, exist_ok=True)
 
     if compiler == "cl":
         std_flag = "/std:c17" if is_c else "/std:c++20"
         lang_flag = "/TC" if is_c else "/TP"
-        cmd = [compiler, file_path, lang_flag, std_flag, "/Fe" + str(output), "/nologo"]
+        cmd = [compiler, str(file_abs), lang_flag, std_flag, "/Fe" + str(output), "/nologo"]
     else:
         std_flag = "-std=c17" if is_c else "-std=c++20"
-        cmd = [compiler, file_path, std_flag, "-O0", "-g", "-o", str(output)]
+        # Skip DWARF emission unless a debugger will be attached; -pipe keeps
+        # intermediates in memory instead of temp files
+        cmd = [compiler, str(file_abs), std_flag, "-O0", "-pipe", "-o", str(output)]
+        if debug:
+            cmd.insert(-2, "-g")
 
-    with log_file.open("a", encoding="utf-8") as log:
-        log.write(f"Compiling with {compiler}\n")
-        subprocess.run(cmd, check=True, stdout=log, stderr=log)
+    os.write(log_fd, f"Compiling with {compiler}\n".encode("utf-8"))
+    run_logged(cmd, log_fd)
 
     return output
 
@@ -137,20 +355,54 @@ def exe_path(target: str, generator: str | None, build_config: str) -> Path:
 
 
 def normalize_target_in_project(file_path: Path, project_root: Path) -> str:
-    # Build target name matching CMakeLists: relative path with '/' -> '_' and suffix with extension
+    # Build target name matching CMakeLists: relative path with '/' -> '_' and suffix with extension.
+    # Both arguments must already be resolved.
     try:
-        rel = file_path.resolve().relative_to(project_root.resolve())
+        rel = file_path.relative_to(project_root).as_posix()
     except Exception:
         # If not relative, return a name that will surely not exist
         rel = file_path.name
-    posix_no_ext = Path(rel).with_suffix("").as_posix()
-    base = posix_no_ext.replace("/", "_")
-    ext = file_path.suffix.lower().lstrip(".")
+    # Split the extension with plain string ops; no intermediate Path objects
+    dot = rel.rfind(".")
+    if dot > rel.rfind("/"):
+        base, ext = rel[:dot], rel[dot + 1:].lower()
+    else:
+        base, ext = rel, ""
+    base = base.replace("/", "_")
     return f"{base}_{ext}" if ext else base
 
 
-def main() -> None:
-    LOG_FILE.write_text("", encoding="utf-8")
+# Flags the fast-path parser must defer to argparse for
+KNOWN_FLAGS = frozenset({
+    "-h", "--help", "-G", "--generator", "--config", "--cmake-arg",
+    "--build-arg", "--debug", "--list-generators", "--print-binary",
+    "--no-rebuild",
+})
+
+
+def parse_args() -> argparse.Namespace:
+    argv = sys.argv[1:]
+    # The common invocation is `run.py file.c [program args...]` with no
+    # script flags at all; skip building argparse's action graph for it.
+    # Any recognized flag anywhere falls back to argparse, which keeps the
+    # semantics authoritative.
+    if argv and not argv[0].startswith("-") and not any(arg in KNOWN_FLAGS for arg in argv):
+        args = argv[1:]
+        # argparse's REMAINDER swallows one leading "--" separator; match it
+        if args and args[0] == "--":
+            args = args[1:]
+        return argparse.Namespace(
+            file=argv[0],
+            args=args,
+            generator=None,
+            config=None,
+            cmake_arg=[],
+            build_arg=[],
+            debug=False,
+            list_generators=False,
+            print_binary=False,
+            no_rebuild=False,
+        )
 
     parser = argparse.ArgumentParser(
         description="Configure, build, and run a single C/C++ file.",
@@ -162,9 +414,15 @@ def main() -> None:
     parser.add_argument("--config", help="Build configuration (e.g., Debug, Release). Overrides CMAKE_BUILD_CONFIG.")
     parser.add_argument("--cmake-arg", action="append", default=[], help="Extra argument to pass to CMake configure (repeatable)")
     parser.add_argument("--build-arg", action="append", default=[], help="Extra argument to pass to CMake build (repeatable)")
+    parser.add_argument("--debug", action="store_true", help="Compile with debug info on the direct-compilation fallback")
+    parser.add_argument("--no-rebuild", action="store_true", help="Skip the build when the binary is newer than the source file")
     parser.add_argument("--list-generators", action="store_true", help="List available CMake generators and exit")
     parser.add_argument("--print-binary", action="store_true", help="Print the binary path and exit (useful for debugging)")
-    parsed = parser.parse_args()
+    return parser.parse_args()
+
+
+def main() -> None:
+    parsed = parse_args()
 
     file_path = parsed.file
     exec_args = parsed.args
@@ -178,7 +436,6 @@ def main() -> None:
         in_project = False
 
     binary: Path | None = None
-    cleanup_dir: Path | None = None
 
     # Early exit: list generators
     if parsed.list_generators:
@@ -194,75 +451,119 @@ def main() -> None:
 
     is_c = Path(file_path).suffix.lower() == ".c"
     build_config = parsed.config or DEFAULT_CONFIG
+    compiler_list = PREFERRED_COMPILERS_C if is_c else PREFERRED_COMPILERS_CXX
+
+    # An explicit -G wins; otherwise an existing build tree pins the
+    # generator and auto-selection only happens on first configure
+    generator_hint = parsed.generator or cached_generator()
 
-    # Early exit: print binary path for debug integration
+    # Early exit: print binary path for debug integration. This sits above
+    # the probe pool on purpose — pool workers are joined at interpreter
+    # exit, so anything submitted here would still block this fast path.
     if parsed.print_binary:
-        project_root_temp = Path.cwd().resolve()
-        file_abs_temp = Path(file_path).resolve()
-        try:
-            file_abs_temp.relative_to(project_root_temp)
-            target_temp = normalize_target_in_project(file_abs_temp, project_root_temp)
-            # Use manual generator if specified, otherwise None for default
-            gen_temp = parsed.generator
-            print(str(exe_path(target_temp, gen_temp, build_config).resolve()))
-        except ValueError:
+        if in_project:
+            target = normalize_target_in_project(file_abs, project_root)
+            # Known generator if available, otherwise a heuristic guess:
+            # only the single- vs multi-config layout matters here
+            gen = generator_hint if generator_hint else _fast_guess_generator()
+            # abspath just prepends the CWD — no per-component lstat walk,
+            # and the debugger consumer does not need symlink canonicalization
+            print(os.path.abspath(exe_path(target, gen, build_config)))
+        else:
             print("(file outside project)")
         sys.exit(0)
 
-    if shutil.which("cmake") is None:
-        print("CMake is not installed or not on PATH; falling back to direct compilation.")
-        compiler_list = PREFERRED_COMPILERS_C if is_c else PREFERRED_COMPILERS_CXX
-        compiler = choose_compiler(compiler_list)
-        if not compiler:
-            fail("No compiler found. Looked for: " + ", ".join(compiler_list))
-
-        try:
-            binary = direct_compile(file_path, compiler, LOG_FILE, is_c)
-            cleanup_dir = binary.parent
-        except subprocess.CalledProcessError as err:
-            fail_with_log(f"Compilation failed with exit code {err.returncode}. Logs at {LOG_FILE}.", LOG_FILE, err.returncode)
-    else:
-        if not in_project:
-            print("Warning: the provided file is outside this project; falling back to direct compilation.")
-            compiler_list = PREFERRED_COMPILERS_C if is_c else PREFERRED_COMPILERS_CXX
-            compiler = choose_compiler(compiler_list)
+    # Probe for cmake, a fallback compiler, and a generator concurrently;
+    # these are independent PATH walks / subprocess waits whose latencies
+    # can overlap
+    import concurrent.futures
+    import shutil
+
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=3)
+    cmake_future = pool.submit(shutil.which, "cmake")
+    compiler_future = pool.submit(choose_compiler, compiler_list)
+    # A known generator makes the capabilities probe pointless; skip it entirely
+    generator_future = None if generator_hint else pool.submit(choose_generator, PREFERRED_GENERATORS)
+    pool.shutdown(wait=False)
+
+    # One shared O_APPEND fd for every build step: the kernel orders the
+    # appends, so there is no userspace buffering to flush between steps
+    log_fd = os.open(LOG_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_APPEND, 0o644)
+    try:
+        if cmake_future.result() is None:
+            print("CMake is not installed or not on PATH; falling back to direct compilation.")
+            compiler = compiler_future.result()
             if not compiler:
                 fail("No compiler found. Looked for: " + ", ".join(compiler_list))
 
             try:
-                binary = direct_compile(file_path, compiler, LOG_FILE, is_c)
-                cleanup_dir = binary.parent
+                binary = direct_compile(file_abs, compiler, log_fd, is_c, parsed.debug)
             except subprocess.CalledProcessError as err:
                 fail_with_log(f"Compilation failed with exit code {err.returncode}. Logs at {LOG_FILE}.", LOG_FILE, err.returncode)
         else:
-            target = normalize_target_in_project(file_abs, project_root)
-            generator = parsed.generator  # Use manual selection only, None means CMake default
-
-            try:
-                configure_build(generator, LOG_FILE, build_config, parsed.cmake_arg)
-                build_target(target, generator, LOG_FILE, build_config, parsed.build_arg)
-            except subprocess.CalledProcessError as err:
-                fail_with_log(f"CMake failed with exit code {err.returncode}. Logs at {LOG_FILE}.", LOG_FILE, err.returncode)
-
-            binary = exe_path(target, generator, build_config)
-            if not binary.exists():
-                fail(f"Built binary not found at {binary}")
+            if not in_project:
+                print("Warning: the provided file is outside this project; falling back to direct compilation.")
+                compiler = compiler_future.result()
+                if not compiler:
+                    fail("No compiler found. Looked for: " + ", ".join(compiler_list))
+
+                try:
+                    binary = direct_compile(file_abs, compiler, log_fd, is_c, parsed.debug)
+                except subprocess.CalledProcessError as err:
+                    fail_with_log(f"Compilation failed with exit code {err.returncode}. Logs at {LOG_FILE}.", LOG_FILE, err.returncode)
+            else:
+                target = normalize_target_in_project(file_abs, project_root)
+                # -G or the existing build tree wins; otherwise prefer the
+                # fastest available generator
+                generator = generator_hint if generator_hint else generator_future.result()
+                binary = exe_path(target, generator, build_config)
+
+                # --no-rebuild: trust an existing binary newer than its
+                # source and skip CMake's up-to-date walk entirely
+                skip_build = (
+                    parsed.no_rebuild
+                    and not parsed.cmake_arg
+                    and not parsed.build_arg
+                    and binary_is_fresh(binary, file_abs)
+                )
+                if skip_build:
+                    os.write(log_fd, b"Binary is fresh; skipping build\n")
+                else:
+                    try:
+                        # Reconfiguring is only needed when the cache is stale or
+                        # the user passed configure-time arguments
+                        if parsed.cmake_arg or not configure_is_fresh(generator, build_config, binary):
+                            configure_build(generator, log_fd, build_config, parsed.cmake_arg)
+                        else:
+                            os.write(log_fd, b"Configure cache is fresh; skipping configure\n")
+                        build_target(target, generator, log_fd, build_config, parsed.build_arg)
+                    except subprocess.CalledProcessError as err:
+                        fail_with_log(f"CMake failed with exit code {err.returncode}. Logs at {LOG_FILE}.", LOG_FILE, err.returncode)
+
+                if not binary.exists():
+                    fail(f"Built binary not found at {binary}")
+    finally:
+        os.close(log_fd)
 
     print(f"--- Executing: {binary}")
     if exec_args:
         print(f"--- Arguments: {' '.join(exec_args)}")
     print("-------------------------------\n")
 
-    try:
-        subprocess.run([str(binary), *exec_args], check=True)
-    except subprocess.CalledProcessError as err:
-        fail(f"Executable returned non-zero exit code {err.returncode}", err.returncode)
-    finally:
-        if cleanup_dir and cleanup_dir.exists():
-            try:
-                shutil.rmtree(cleanup_dir)
-            except OSError:
-                pass
+    sys.stdout.flush()
+    if os.name != "nt":
+        # Every binary now lives under build/, so there is nothing to clean
+        # up; replace this process with the built binary instead of
+        # parenting a child. An absolute bytes path lets execv skip PATH
+        # resolution and re-encoding entirely.
+        binary_bytes = os.fsencode(binary.resolve())
+        os.execv(binary_bytes, [binary_bytes, *map(os.fsencode, exec_args)])
+
+    # Windows exec* spawns the child and kills this process immediately,
+    # returning the console to the shell mid-run and losing the exit code;
+    # keep the wait-and-propagate tail there
+    result = subprocess.run([str(binary), *exec_args])
+    sys.exit(result.returncode)
 
 
 if __name__ == "__main__":